@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 from collections import Counter
 from datetime import date, datetime, timezone
@@ -10,18 +9,8 @@ from typing import List, Optional
 
 from .models import SurveyQuery
 from .runner import SurveyRunner
-from .stats import (
-    brand_new_filtered,
-    format_numeric_summary,
-    group_by_age_difference,
-    group_by_aspect,
-    group_by_auto_lock,
-    group_by_bath,
-    summarize_area_rent,
-    summarize_rent,
-    summarize_total_rent,
-)
-from .utils import ensure_output_path, write_output
+from .stats import compute_all_groupings, format_numeric_summary, summarize_listings
+from .utils import dumps_json, ensure_output_path, write_output
 
 DEFAULT_SAFARI_UA = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_5) "
@@ -123,7 +112,7 @@ def print_summary(result, query: SurveyQuery, output_path) -> None:
     print(f"Generated at: {timestamp}")
     print(f"Output file: {output_path}")
     if result.skipped_sites:
-        print("Skipped sites:", json.dumps(result.skipped_sites, ensure_ascii=False))
+        print("Skipped sites:", dumps_json(result.skipped_sites).decode("utf-8"))
     raw_counts = Counter([l.site for l in result.raw_listings])
     filtered_counts = Counter([l.site for l in result.filtered_listings])
     print("Site counts (raw):", dict(raw_counts))
@@ -131,27 +120,26 @@ def print_summary(result, query: SurveyQuery, output_path) -> None:
     print(f"Raw listings: {len(result.raw_listings)}")
     print(f"Filtered listings: {len(result.filtered_listings)}")
     print(f"Deduplicated listings: {len(result.deduplicated_listings)}")
-    total_summary = summarize_total_rent(result.deduplicated_listings)
-    print(format_numeric_summary("Total rent", total_summary))
-    rent_summary = summarize_rent(result.deduplicated_listings)
-    print(format_numeric_summary("Rent", rent_summary))
-    area_summary = summarize_area_rent(result.deduplicated_listings)
-    print(format_numeric_summary("Rent per sqm", area_summary))
+    summary = summarize_listings(result.deduplicated_listings)
+    print(format_numeric_summary("Total rent", summary.total_rent))
+    print(format_numeric_summary("Rent", summary.rent))
+    print(format_numeric_summary("Rent per sqm", summary.rent_per_sqm))
+    groups = compute_all_groupings(result.deduplicated_listings, query.age_diff)
     if query.age_diff:
-        for group in group_by_age_difference(result.deduplicated_listings, query.age_diff):
+        for group in groups.age_groups:
             print(format_numeric_summary(f"Age diff {group.label}", group.summary))
-    for group in group_by_auto_lock(result.deduplicated_listings):
+    for group in groups.auto_lock_groups:
         print(format_numeric_summary(f"Auto lock {group.label}", group.summary))
-    for group in group_by_bath(result.deduplicated_listings):
+    for group in groups.bath_groups:
         print(format_numeric_summary(f"Bath {group.label}", group.summary))
-    aspect_counts = group_by_aspect(result.deduplicated_listings)
-    print("Aspect distribution:", aspect_counts)
+    print("Aspect distribution:", groups.aspect_counts)
     if query.brand_new_separate_stats:
-        filtered = brand_new_filtered(result.deduplicated_listings)
+        filtered = groups.without_brand_new
         if filtered:
             print("-- Without brand-new units --")
-            print(format_numeric_summary("Total rent", summarize_total_rent(filtered)))
-            print(format_numeric_summary("Rent", summarize_rent(filtered)))
+            filtered_summary = summarize_listings(filtered)
+            print(format_numeric_summary("Total rent", filtered_summary.total_rent))
+            print(format_numeric_summary("Rent", filtered_summary.rent))
 
 
 if __name__ == "__main__":  # pragma: no cover
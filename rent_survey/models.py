@@ -6,7 +6,7 @@ from datetime import datetime, date
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SurveyQuery:
     """Normalized representation of CLI arguments."""
 
@@ -27,7 +27,7 @@ class SurveyQuery:
     brand_new_separate_stats: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class RentalListing:
     """Normalized rental listing across sites."""
 
@@ -54,13 +54,15 @@ class RentalListing:
     collected_at: datetime
     raw: Dict[str, Any] = field(default_factory=dict)
     sources: List[str] = field(default_factory=list)
+    # Set by site clients once the identifying fields are parsed; see utils.listing_dedup_key.
+    dedup_key: Optional[int] = None
 
     def merge_source(self, other_site: str) -> None:
         if other_site not in self.sources:
             self.sources.append(other_site)
 
 
-@dataclass
+@dataclass(slots=True)
 class SurveyResult:
     """Holds raw/filtered/deduplicated listings."""
 
@@ -70,7 +72,7 @@ class SurveyResult:
     skipped_sites: Dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class NumericSummary:
     count: int
     average: Optional[float]
@@ -79,7 +81,27 @@ class NumericSummary:
     maximum: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupSummary:
     label: str
     summary: NumericSummary
+
+
+@dataclass(slots=True)
+class ListingSummary:
+    """Headline summaries computed together from one column build."""
+
+    total_rent: NumericSummary
+    rent: NumericSummary
+    rent_per_sqm: NumericSummary
+
+
+@dataclass(slots=True)
+class GroupBundle:
+    """All per-listing groupings used by the summary, built in one pass."""
+
+    age_groups: List[GroupSummary]
+    auto_lock_groups: List[GroupSummary]
+    bath_groups: List[GroupSummary]
+    aspect_counts: Dict[str, int]
+    without_brand_new: List[RentalListing]
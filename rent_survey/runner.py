@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Type
+
+import httpx
 
 from .models import RentalListing, SurveyQuery, SurveyResult
 from .sites.homes import HomesClient
 from .sites.suumo import SuumoClient
 from .sites.base import SiteClient
-from .utils import RateLimitedClient, deduplicate, filter_listings
+from .utils import RateLimitedClient, build_http_session, deduplicate, filter_listings
 
 logger = logging.getLogger(__name__)
 
@@ -30,21 +33,28 @@ class SurveyRunner:
     def run(self) -> SurveyResult:
         listings: List[RentalListing] = []
         skipped: Dict[str, str] = {}
+        targets: List[Tuple[str, Type[SiteClient]]] = []
         for site_name in self.query.sites:
             client_cls = SITE_REGISTRY.get(site_name)
             if not client_cls:
                 skipped[site_name] = "unsupported_site"
                 continue
-            http = RateLimitedClient(self.user_agent, min_interval=self.min_interval, timeout=self.request_timeout)
-            client = client_cls(http)
-            try:
-                site_results = client.search(self.query, self.query.max_listings)
-                listings.extend(site_results)
-            except Exception as exc:  # pragma: no cover - network dependent
-                logger.warning("Failed to fetch from %s: %s", site_name, exc)
-                skipped[site_name] = str(exc)
-            finally:
-                http.close()
+            targets.append((site_name, client_cls))
+        # Sites are independent and network bound, so search them in parallel.
+        # Each site keeps its own RateLimitedClient, so per-site pacing is unchanged,
+        # while the underlying connection pool is shared.
+        with build_http_session(self.user_agent, timeout=self.request_timeout) as session:
+            with ThreadPoolExecutor(max_workers=max(1, len(targets))) as pool:
+                futures = [
+                    (site_name, pool.submit(self._search_site, client_cls, session))
+                    for site_name, client_cls in targets
+                ]
+                for site_name, future in futures:
+                    try:
+                        listings.extend(future.result())
+                    except Exception as exc:  # pragma: no cover - network dependent
+                        logger.warning("Failed to fetch from %s: %s", site_name, exc)
+                        skipped[site_name] = str(exc)
         filtered = filter_listings(listings, self.query)
         deduped = deduplicate(filtered)
         return SurveyResult(
@@ -53,3 +63,13 @@ class SurveyRunner:
             deduplicated_listings=deduped,
             skipped_sites=skipped,
         )
+
+    def _search_site(self, client_cls: Type[SiteClient], session: httpx.Client) -> List[RentalListing]:
+        http = RateLimitedClient(
+            self.user_agent, min_interval=self.min_interval, timeout=self.request_timeout, client=session
+        )
+        client = client_cls(http)
+        try:
+            return client.search(self.query, self.query.max_listings)
+        finally:
+            http.close()
@@ -2,21 +2,78 @@
 from __future__ import annotations
 
 import logging
+import math
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 
-from bs4 import BeautifulSoup
+import httpx
+import lxml.etree
+import lxml.html
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
 
 from ..models import RentalListing, SurveyQuery
 from ..utils import RateLimitedClient
 
 logger = logging.getLogger(__name__)
 
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+Selector = Callable[[HtmlElement], List[HtmlElement]]
+
+
+@lru_cache(maxsize=None)
+def css(expr: str) -> Selector:
+    """Compile a CSS selector once; use at class level for per-card lookups."""
+
+    return CSSSelector(expr, translator="html")
+
+
+def select_one(node: HtmlElement, selector: Selector) -> Optional[HtmlElement]:
+    found = selector(node)
+    return found[0] if found else None
+
+
+def node_text(node: Optional[HtmlElement]) -> Optional[str]:
+    """Concatenate stripped text like BeautifulSoup's ``get_text(strip=True)``.
+
+    Returns None for a missing node so callers can keep "absent" and "empty"
+    apart. Script/style contents and comments are skipped.
+    """
+
+    if node is None:
+        return None
+    parts: List[str] = []
+    for element in node.iter():
+        if isinstance(element.tag, str) and element.tag not in _NON_TEXT_TAGS and element.text:
+            parts.append(element.text.strip())
+        if element is not node and element.tail:
+            parts.append(element.tail.strip())
+    return "".join(parts)
+
+
+def parse_html(content: bytes, encoding: Optional[str] = None) -> HtmlElement:
+    """Parse a page body the same way as ``src.utils.html_tree.parse_html`` (see there)."""
+
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        parser = lxml.html.HTMLParser()
+    try:
+        return lxml.html.document_fromstring(content, parser=parser)
+    except lxml.etree.ParserError:
+        return lxml.html.document_fromstring(b"<html></html>")
+
 
 class SiteClient(ABC):
     """Abstract search client for a rent site."""
 
     site_name: str
+    PAGER_SELECTOR: Optional[Selector] = None
+    MAX_PAGE_WORKERS = 4
 
     def __init__(self, http_client: RateLimitedClient):
         self.http = http_client
@@ -26,8 +83,59 @@ class SiteClient(ABC):
         raise NotImplementedError
 
     @staticmethod
-    def build_soup(html: str) -> BeautifulSoup:
-        return BeautifulSoup(html, "lxml")
+    def build_tree(response: httpx.Response) -> HtmlElement:
+        return parse_html(response.content, response.encoding)
 
     def log_skip(self, reason: str) -> None:
         logger.warning("%s skipped: %s", self.site_name, reason)
+
+    def total_pages(self, tree: HtmlElement) -> int:
+        """Return the last page number advertised by the pager (1 if absent)."""
+
+        pages = [1]
+        for link in self.PAGER_SELECTOR(tree) if self.PAGER_SELECTOR else []:
+            text = node_text(link)
+            if text.isdigit():
+                pages.append(int(text))
+        return max(pages)
+
+    def remaining_pages(self, tree: HtmlElement, first_page_count: int, limit: int) -> List[int]:
+        """Page numbers after the first one that are needed to reach ``limit``."""
+
+        if first_page_count == 0 or first_page_count >= limit:
+            return []
+        needed = math.ceil(limit / first_page_count)
+        return list(range(2, min(needed, self.total_pages(tree)) + 1))
+
+    def fetch_pages(
+        self, url: str, params_list: List[Dict], parse: Callable[[HtmlElement], List[RentalListing]]
+    ) -> List[List[RentalListing]]:
+        """Fetch and parse follow-up pages concurrently, keeping page order.
+
+        Requests still go through the shared RateLimitedClient, so the
+        configured interval applies; concurrency only hides response latency.
+        Each worker parses its own page (lxml releases the GIL while parsing),
+        so parsing overlaps with the remaining fetches. Pages after the first
+        failure are dropped.
+        """
+
+        if not params_list:
+            return []
+        pages: List[List[RentalListing]] = []
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PAGE_WORKERS, len(params_list))) as pool:
+            futures = [pool.submit(self._fetch_page, url, params, parse) for params in params_list]
+            for future in futures:
+                try:
+                    pages.append(future.result())
+                except Exception as exc:  # pragma: no cover - network dependent
+                    self.log_skip(f"pagination stopped: {exc}")
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        return pages
+
+    def _fetch_page(
+        self, url: str, params: Dict, parse: Callable[[HtmlElement], List[RentalListing]]
+    ) -> List[RentalListing]:
+        response = self.http.get(url, params=params)
+        return parse(self.build_tree(response))
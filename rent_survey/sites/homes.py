@@ -3,43 +3,83 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
-from bs4 import BeautifulSoup
+from lxml.html import HtmlElement
 
 from ..models import RentalListing, SurveyQuery
 from ..utils import (
     RateLimitedClient,
+    SubjectAge,
     compute_age_difference,
+    listing_dedup_key,
     parse_area,
     parse_built_info,
     parse_station_walk,
     parse_yen,
+    precompute_subject_age,
 )
-from .base import SiteClient
+from .base import SiteClient, css, node_text, select_one
 
 logger = logging.getLogger(__name__)
 
+HOMES_ORIGIN = "https://www.homes.co.jp"
+
 
 class HomesClient(SiteClient):
     site_name = "homes"
-    BASE_URL = "https://www.homes.co.jp/chintai/list/"
+    BASE_URL = f"{HOMES_ORIGIN}/chintai/list/"
+    PAGER_SELECTOR = css("ul.pagination li a")
+    _SEL_CARD = css("div.mod-property-list div.property")
+    _SEL_TITLE = css("h2.property-title a")
+    _SEL_RENT = css("span.price strong")
+    _SEL_MANAGEMENT = css("span.price span.property-data")
+    _SEL_DEPOSIT = css("span.shikikin")
+    _SEL_KEY_MONEY = css("span.reikin")
+    _SEL_AREA = css("span.menseki")
+    _SEL_MADORI = css("span.madori")
+    _SEL_BUILT = css("span.chikunen")
+    _SEL_STATION = css("div.property-point p")
 
     def __init__(self, http_client: RateLimitedClient):
         super().__init__(http_client)
 
     def search(self, query: SurveyQuery, limit: int) -> List[RentalListing]:
         params = self._build_query_params(query)
+        collected_at = datetime.now(timezone.utc)
+        subject_age = precompute_subject_age(query.subject_built)
         response = self.http.get(self.BASE_URL, params=params)
-        soup = self.build_soup(response.text)
+
+        def parse(page: HtmlElement) -> List[RentalListing]:
+            return self._parse_page(page, query, limit, collected_at, subject_age)
+
+        tree = self.build_tree(response)
+        listings = parse(tree)
+        pages = self.remaining_pages(tree, len(listings), limit)
+        for page_listings in self.fetch_pages(self.BASE_URL, self._build_page_params(params, pages), parse):
+            listings.extend(page_listings)
+        return listings[:limit]
+
+    def _parse_page(
+        self,
+        tree: HtmlElement,
+        query: SurveyQuery,
+        limit: int,
+        collected_at: datetime,
+        subject_age: Optional[SubjectAge],
+    ) -> List[RentalListing]:
         listings: List[RentalListing] = []
-        for card in soup.select("div.mod-property-list div.property" ):
-            listing = self._parse_card(card, query)
+        for card in self._SEL_CARD(tree):
+            listing = self._parse_card(card, query, collected_at, subject_age)
             if listing:
                 listings.append(listing)
             if len(listings) >= limit:
                 break
-        return listings[:limit]
+        return listings
+
+    def _build_page_params(self, params: dict, pages: List[int]) -> List[dict]:
+        return [{**params, "page": page} for page in pages]
 
     def _build_query_params(self, query: SurveyQuery) -> dict:
         params = {
@@ -59,51 +99,58 @@ class HomesClient(SiteClient):
             params["bath_toilet"] = "separate"
         return params
 
-    def _parse_card(self, card: BeautifulSoup, query: SurveyQuery) -> RentalListing | None:
-        title_el = card.select_one("h2.property-title a")
-        title = title_el.get_text(strip=True) if title_el else ""
-        url = title_el["href"] if title_el and title_el.has_attr("href") else self.BASE_URL
-        rent_el = card.select_one("span.price strong")
-        management_el = card.select_one("span.price span.property-data")
-        deposit_el = card.select_one("span.shikikin")
-        key_el = card.select_one("span.reikin")
-        area_el = card.select_one("span.menseki")
-        madori_el = card.select_one("span.madori")
-        built_el = card.select_one("span.chikunen")
-        station_el = card.select_one("div.property-point p")
-        built_text = built_el.get_text(strip=True) if built_el else None
+    def _parse_card(
+        self, card: HtmlElement, query: SurveyQuery, collected_at: datetime, subject_age: Optional[SubjectAge]
+    ) -> RentalListing | None:
+        # Cards without a rent (ads, banners) are useless for comparison; drop them
+        # before doing the remaining lookups.
+        rent = parse_yen(node_text(select_one(card, self._SEL_RENT)))
+        if rent is None:
+            return None
+        title_el = select_one(card, self._SEL_TITLE)
+        title = node_text(title_el) or ""
+        url = title_el.get("href", self.BASE_URL) if title_el is not None else self.BASE_URL
+        management_el = select_one(card, self._SEL_MANAGEMENT)
+        deposit_el = select_one(card, self._SEL_DEPOSIT)
+        key_el = select_one(card, self._SEL_KEY_MONEY)
+        area_el = select_one(card, self._SEL_AREA)
+        madori_el = select_one(card, self._SEL_MADORI)
+        built_el = select_one(card, self._SEL_BUILT)
+        station_el = select_one(card, self._SEL_STATION)
+        built_text = node_text(built_el)
         built_info = parse_built_info(built_text or "")
         built_at = built_info["built_at"]
         built_age = built_info["built_age_years"]
-        station_info = parse_station_walk(station_el.get_text(strip=True) if station_el else "")
+        station_info = parse_station_walk(node_text(station_el))
         listing = RentalListing(
             title=title,
             site=self.site_name,
             url=self._absolute_url(url),
-            rent=parse_yen(rent_el.get_text(strip=True) if rent_el else ""),
-            management_fee=parse_yen(management_el.get_text(strip=True) if management_el else ""),
+            rent=rent,
+            management_fee=parse_yen(node_text(management_el)),
             total_rent=None,
-            deposit=parse_yen(deposit_el.get_text(strip=True) if deposit_el else ""),
-            key_money=parse_yen(key_el.get_text(strip=True) if key_el else ""),
-            area=parse_area(area_el.get_text(strip=True) if area_el else None),
-            madori=madori_el.get_text(strip=True) if madori_el else None,
+            deposit=parse_yen(node_text(deposit_el)),
+            key_money=parse_yen(node_text(key_el)),
+            area=parse_area(node_text(area_el)),
+            madori=node_text(madori_el),
             built_at=built_at,
             built_at_text=built_text,
             built_age_years=built_age,
-            age_diff_from_subject=compute_age_difference(query.subject_built, built_at, built_age),
+            age_diff_from_subject=compute_age_difference(subject_age, built_at, built_age),
             station=station_info["station"],
             walk_minutes=station_info["walk_minutes"],
             building_type=query.building_type,
             auto_lock=True if query.auto_lock == "required" else None,
             bath_toilet_separate=True if query.bath_toilet == "required" else None,
             aspect=None,
-            collected_at=datetime.now(timezone.utc),
+            collected_at=collected_at,
             raw={"source": "homes"},
         )
         listing.total_rent = (listing.rent or 0) + (listing.management_fee or 0)
+        listing.dedup_key = listing_dedup_key(listing)
         return listing
 
-    def _absolute_url(self, href: str) -> str:
-        if href.startswith("http"):
-            return href
-        return f"https://www.homes.co.jp{href}"
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _absolute_url(href: str) -> str:
+        return href if href[:4] == "http" else HOMES_ORIGIN + href
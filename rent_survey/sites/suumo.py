@@ -3,41 +3,85 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
-from bs4 import BeautifulSoup
+from lxml.html import HtmlElement
 
 from ..models import RentalListing, SurveyQuery
 from ..utils import (
     RateLimitedClient,
+    SubjectAge,
     compute_age_difference,
+    listing_dedup_key,
     parse_area,
     parse_built_info,
     parse_station_walk,
     parse_yen,
+    precompute_subject_age,
 )
-from .base import SiteClient
+from .base import SiteClient, css, node_text, select_one
 
 logger = logging.getLogger(__name__)
 
+SUUMO_ORIGIN = "https://suumo.jp"
+
 
 class SuumoClient(SiteClient):
     site_name = "suumo"
-    BASE_URL = "https://suumo.jp/chintai/"
+    BASE_URL = f"{SUUMO_ORIGIN}/chintai/"
+    PAGER_SELECTOR = css("div.pagination_set-nav ol.pagination-parts li a")
+    _SEL_CASSETTE = css("div.cassetteitem")
+    _SEL_TITLE = css("div.cassetteitem_content-title")
+    _SEL_STATION = css("div.cassetteitem_detail-text")
+    _SEL_BUILDING_TYPE = css("div.cassetteitem_content-label")
+    _SEL_TABLE = css("table.cassetteitem_other")
+    _SEL_ROWS = css("tbody tr")
+    _SEL_RENT = css("td.cassetteitem_price--rent")
+    _SEL_MANAGEMENT = css("td.cassetteitem_price--administration")
+    _SEL_DEPOSIT = css("td.cassetteitem_price--deposit")
+    _SEL_KEY_MONEY = css("td.cassetteitem_price--gratuity")
+    _SEL_MADORI = css("td.cassetteitem_madori")
+    _SEL_AREA = css("td.cassetteitem_menseki")
+    _SEL_LINK = css("a")
+    _SEL_BUILT = css("td.cassetteitem_col4")
 
     def __init__(self, http_client: RateLimitedClient):
         super().__init__(http_client)
 
     def search(self, query: SurveyQuery, limit: int) -> List[RentalListing]:
         params = self._build_query_params(query)
+        collected_at = datetime.now(timezone.utc)
+        subject_age = precompute_subject_age(query.subject_built)
         response = self.http.get(self.BASE_URL, params=params)
-        soup = self.build_soup(response.text)
+
+        def parse(page: HtmlElement) -> List[RentalListing]:
+            return self._parse_page(page, query, limit, collected_at, subject_age)
+
+        tree = self.build_tree(response)
+        listings = parse(tree)
+        pages = self.remaining_pages(tree, len(listings), limit)
+        for page_listings in self.fetch_pages(self.BASE_URL, self._build_page_params(params, pages), parse):
+            listings.extend(page_listings)
+        return listings[:limit]
+
+    def _parse_page(
+        self,
+        tree: HtmlElement,
+        query: SurveyQuery,
+        limit: int,
+        collected_at: datetime,
+        subject_age: Optional[SubjectAge],
+    ) -> List[RentalListing]:
         listings: List[RentalListing] = []
-        for cassette in soup.select("div.cassetteitem"):
-            listings.extend(self._parse_cassette(cassette, query))
+        for cassette in self._SEL_CASSETTE(tree):
+            listings.extend(self._parse_cassette(cassette, query, collected_at, subject_age))
             if len(listings) >= limit:
                 break
-        return listings[:limit]
+        return listings
+
+    def _build_page_params(self, params: dict, pages: List[int]) -> List[dict]:
+        return [{**params, "pn": page} for page in pages]
 
     def _build_query_params(self, query: SurveyQuery) -> dict:
         params = {
@@ -54,57 +98,63 @@ class SuumoClient(SiteClient):
             params["ct"] = query.age_max
         return params
 
-    def _parse_cassette(self, cassette: BeautifulSoup, query: SurveyQuery) -> List[RentalListing]:
-        title = cassette.select_one("div.cassetteitem_content-title")
-        title_text = title.get_text(strip=True) if title else ""
-        station_text = cassette.select_one("div.cassetteitem_detail-text")
-        station_info = parse_station_walk(station_text.get_text(strip=True) if station_text else "")
-        building_type = cassette.select_one("div.cassetteitem_content-label")
-        table = cassette.select_one("table.cassetteitem_other")
-        rows = table.select("tbody tr") if table else []
+    def _parse_cassette(
+        self, cassette: HtmlElement, query: SurveyQuery, collected_at: datetime, subject_age: Optional[SubjectAge]
+    ) -> List[RentalListing]:
+        title = select_one(cassette, self._SEL_TITLE)
+        title_text = node_text(title) or ""
+        station_text = select_one(cassette, self._SEL_STATION)
+        station_info = parse_station_walk(node_text(station_text))
+        building_type = select_one(cassette, self._SEL_BUILDING_TYPE)
+        table = select_one(cassette, self._SEL_TABLE)
+        rows = self._SEL_ROWS(table) if table is not None else []
         listings: List[RentalListing] = []
         for row in rows:
-            rent_cell = row.select_one("td.cassetteitem_price--rent")
-            admin_cell = row.select_one("td.cassetteitem_price--administration")
-            deposit_cell = row.select_one("td.cassetteitem_price--deposit")
-            key_cell = row.select_one("td.cassetteitem_price--gratuity")
-            madori_cell = row.select_one("td.cassetteitem_madori")
-            area_cell = row.select_one("td.cassetteitem_menseki")
-            link = row.select_one("a")
-            built_cell = row.select_one("td.cassetteitem_col4")
-            built_text = built_cell.get_text(strip=True) if built_cell else None
+            # Rows without a rent (headers, ads) are skipped before any other lookup.
+            rent = parse_yen(node_text(select_one(row, self._SEL_RENT)))
+            if rent is None:
+                continue
+            admin_cell = select_one(row, self._SEL_MANAGEMENT)
+            deposit_cell = select_one(row, self._SEL_DEPOSIT)
+            key_cell = select_one(row, self._SEL_KEY_MONEY)
+            madori_cell = select_one(row, self._SEL_MADORI)
+            area_cell = select_one(row, self._SEL_AREA)
+            link = select_one(row, self._SEL_LINK)
+            built_cell = select_one(row, self._SEL_BUILT)
+            built_text = node_text(built_cell)
             built_info = parse_built_info(built_text or "")
             built_at = built_info["built_at"]
             built_age = built_info["built_age_years"]
             listing = RentalListing(
                 title=title_text,
                 site=self.site_name,
-                url=self._absolute_url(link["href"]) if link and link.has_attr("href") else self.BASE_URL,
-                rent=parse_yen(rent_cell.get_text(strip=True) if rent_cell else ""),
-                management_fee=parse_yen(admin_cell.get_text(strip=True) if admin_cell else ""),
+                url=self._absolute_url(link.get("href")) if link is not None and "href" in link.attrib else self.BASE_URL,
+                rent=rent,
+                management_fee=parse_yen(node_text(admin_cell)),
                 total_rent=None,
-                deposit=parse_yen(deposit_cell.get_text(strip=True) if deposit_cell else ""),
-                key_money=parse_yen(key_cell.get_text(strip=True) if key_cell else ""),
-                area=parse_area(area_cell.get_text(strip=True) if area_cell else None),
-                madori=madori_cell.get_text(strip=True) if madori_cell else None,
+                deposit=parse_yen(node_text(deposit_cell)),
+                key_money=parse_yen(node_text(key_cell)),
+                area=parse_area(node_text(area_cell)),
+                madori=node_text(madori_cell),
                 built_at=built_at,
                 built_at_text=built_text,
                 built_age_years=built_age,
-                age_diff_from_subject=compute_age_difference(query.subject_built, built_at, built_age),
+                age_diff_from_subject=compute_age_difference(subject_age, built_at, built_age),
                 station=station_info["station"],
                 walk_minutes=station_info["walk_minutes"],
-                building_type=building_type.get_text(strip=True) if building_type else None,
+                building_type=node_text(building_type),
                 auto_lock=None,
                 bath_toilet_separate=None,
                 aspect=None,
-                collected_at=datetime.now(timezone.utc),
+                collected_at=collected_at,
                 raw={"source": "suumo"},
             )
             listing.total_rent = (listing.rent or 0) + (listing.management_fee or 0)
+            listing.dedup_key = listing_dedup_key(listing)
             listings.append(listing)
         return listings
 
-    def _absolute_url(self, href: str) -> str:
-        if href.startswith("http"):
-            return href
-        return f"https://suumo.jp{href}"
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _absolute_url(href: str) -> str:
+        return href if href[:4] == "http" else SUUMO_ORIGIN + href
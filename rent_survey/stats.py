@@ -2,92 +2,135 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import asdict
-from statistics import mean, median
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
-from .models import GroupSummary, NumericSummary, RentalListing
+import numpy as np
 
+from .models import GroupBundle, GroupSummary, ListingSummary, NumericSummary, RentalListing
 
-def _safe_mean(values: List[float]) -> Optional[float]:
-    return mean(values) if values else None
 
+def _as_array(values: Union[np.ndarray, Iterable[Optional[float]]]) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    return np.fromiter((v for v in values if v is not None), dtype=np.float64)
 
-def _safe_median(values: List[float]) -> Optional[float]:
-    return median(values) if values else None
 
+# Below this size a full sort (which also yields min/max) beats partitioning.
+_PARTITION_MIN_SIZE = 16
 
-def summarize_numeric(values: Iterable[float]) -> NumericSummary:
-    data = list(values)
+
+def _sorted_median(ordered: np.ndarray) -> float:
+    mid = ordered.size // 2
+    if ordered.size % 2:
+        return float(ordered[mid])
+    return float((ordered[mid - 1] + ordered[mid]) / 2)
+
+
+def _partition_median(values: np.ndarray) -> float:
+    """O(n) median via np.partition instead of a full sort."""
+
+    mid = values.size // 2
+    if values.size % 2:
+        return float(np.partition(values, mid)[mid])
+    part = np.partition(values, (mid - 1, mid))
+    return float((part[mid - 1] + part[mid]) / 2)
+
+
+def summarize_numeric(values: Union[np.ndarray, Iterable[Optional[float]]]) -> NumericSummary:
+    data = _as_array(values)
+    count = int(data.size)
+    if not count:
+        return NumericSummary(count=0, average=None, median=None, minimum=None, maximum=None)
+    if count < _PARTITION_MIN_SIZE:
+        # One sort yields min, max and median.
+        ordered = np.sort(data)
+        median, minimum, maximum = _sorted_median(ordered), ordered[0], ordered[-1]
+    else:
+        median, minimum, maximum = _partition_median(data), data.min(), data.max()
     return NumericSummary(
-        count=len(data),
-        average=_safe_mean(data),
-        median=_safe_median(data),
-        minimum=min(data) if data else None,
-        maximum=max(data) if data else None,
+        count=count,
+        average=float(data.sum() / count),
+        median=median,
+        minimum=float(minimum),
+        maximum=float(maximum),
     )
 
 
 def summarize_total_rent(listings: List[RentalListing]) -> NumericSummary:
-    totals = [l.total_rent for l in listings if l.total_rent is not None]
-    return summarize_numeric(totals)
-
-
-def summarize_rent(listings: List[RentalListing]) -> NumericSummary:
-    rents = [l.rent for l in listings if l.rent is not None]
-    return summarize_numeric(rents)
+    # _as_array drops missing (None) values.
+    return summarize_numeric(l.total_rent for l in listings)
+
+
+def summarize_listings(listings: List[RentalListing]) -> ListingSummary:
+    """Summarize total rent, rent and rent per sqm from a single pass over listings."""
+
+    # None becomes NaN, so each column can be filtered without revisiting listings.
+    columns = np.array([(l.total_rent, l.rent, l.area) for l in listings], dtype=np.float64).reshape(-1, 3)
+    totals, rents, areas = columns[:, 0], columns[:, 1], columns[:, 2]
+    has_total = ~np.isnan(totals)
+    per_sqm = (np.nan_to_num(totals) != 0) & (np.nan_to_num(areas) != 0)
+    return ListingSummary(
+        total_rent=summarize_numeric(totals[has_total]),
+        rent=summarize_numeric(rents[~np.isnan(rents)]),
+        rent_per_sqm=summarize_numeric(totals[per_sqm] / areas[per_sqm]),
+    )
 
 
-def summarize_area_rent(listings: List[RentalListing]) -> NumericSummary:
-    unit = [l.total_rent / l.area for l in listings if l.total_rent and l.area]
-    return summarize_numeric(unit)
+# Tri-state flags are bucketed by index: 0 = False, 1 = True, 2 = unknown (None).
+AUTO_LOCK_LABELS = ("no_auto_lock", "auto_lock", "unknown")
+BATH_LABELS = ("unit_bath", "bath_toilet_separate", "unknown")
 
 
-def group_by_auto_lock(listings: List[RentalListing]) -> List[GroupSummary]:
-    groups: Dict[str, List[RentalListing]] = defaultdict(list)
-    for listing in listings:
-        key = "auto_lock" if listing.auto_lock else "no_auto_lock" if listing.auto_lock is False else "unknown"
-        groups[key].append(listing)
-    return [GroupSummary(label=k, summary=summarize_total_rent(v)) for k, v in groups.items()]
+def _tri_state_index(value: Optional[bool]) -> int:
+    return 2 if value is None else 1 if value else 0
 
 
-def group_by_bath(listings: List[RentalListing]) -> List[GroupSummary]:
-    groups: Dict[str, List[RentalListing]] = defaultdict(list)
-    for listing in listings:
-        key = "bath_toilet_separate" if listing.bath_toilet_separate else "unit_bath" if listing.bath_toilet_separate is False else "unknown"
-        groups[key].append(listing)
-    return [GroupSummary(label=k, summary=summarize_total_rent(v)) for k, v in groups.items()]
+def _tri_state_groups(buckets: Tuple[List[RentalListing], ...], labels: Tuple[str, ...]) -> List[GroupSummary]:
+    return [
+        GroupSummary(label=label, summary=summarize_total_rent(bucket))
+        for label, bucket in zip(labels, buckets)
+        if bucket
+    ]
 
 
-def group_by_aspect(listings: List[RentalListing]) -> Dict[str, int]:
-    counts: Dict[str, int] = defaultdict(int)
-    for listing in listings:
-        label = listing.aspect or "unknown"
-        counts[label] += 1
-    return dict(counts)
+def compute_all_groupings(listings: List[RentalListing], age_diff: Optional[int]) -> GroupBundle:
+    """Bucket listings by age difference, auto lock, bath and aspect in a single loop.
 
+    ``without_brand_new`` drops listings younger than one year.
+    """
 
-def group_by_age_difference(listings: List[RentalListing], age_diff: Optional[int]) -> List[GroupSummary]:
-    if age_diff is None:
-        return []
+    auto_lock: Tuple[List[RentalListing], ...] = ([], [], [])
+    bath: Tuple[List[RentalListing], ...] = ([], [], [])
+    aspect_counts: Dict[str, int] = defaultdict(int)
     within: List[RentalListing] = []
     outside: List[RentalListing] = []
+    without_brand_new: List[RentalListing] = []
     for listing in listings:
+        auto_lock[_tri_state_index(listing.auto_lock)].append(listing)
+        bath[_tri_state_index(listing.bath_toilet_separate)].append(listing)
+        aspect_counts[listing.aspect or "unknown"] += 1
         diff = listing.age_diff_from_subject
-        if diff is None:
-            continue
-        (within if abs(diff) <= age_diff else outside).append(listing)
-    return [
-        GroupSummary(label=f"within_±{age_diff}", summary=summarize_total_rent(within)),
-        GroupSummary(label=f"outside_±{age_diff}", summary=summarize_total_rent(outside)),
-    ]
-
-
-def brand_new_filtered(listings: List[RentalListing]) -> List[RentalListing]:
-    return [l for l in listings if not (l.built_age_years is not None and l.built_age_years < 1)]
+        if age_diff is not None and diff is not None:
+            (within if abs(diff) <= age_diff else outside).append(listing)
+        if not (listing.built_age_years is not None and listing.built_age_years < 1):
+            without_brand_new.append(listing)
+    age_groups: List[GroupSummary] = []
+    if age_diff is not None:
+        age_groups = [
+            GroupSummary(label=f"within_±{age_diff}", summary=summarize_total_rent(within)),
+            GroupSummary(label=f"outside_±{age_diff}", summary=summarize_total_rent(outside)),
+        ]
+    return GroupBundle(
+        age_groups=age_groups,
+        auto_lock_groups=_tri_state_groups(auto_lock, AUTO_LOCK_LABELS),
+        bath_groups=_tri_state_groups(bath, BATH_LABELS),
+        aspect_counts=dict(aspect_counts),
+        without_brand_new=without_brand_new,
+    )
 
 
 def format_numeric_summary(label: str, summary: NumericSummary) -> str:
-    data = asdict(summary)
-    parts = [f"{k}={v}" for k, v in data.items()]
-    return f"{label}: " + ", ".join(parts)
+    return (
+        f"{label}: count={summary.count}, average={summary.average}, median={summary.median}, "
+        f"minimum={summary.minimum}, maximum={summary.maximum}"
+    )
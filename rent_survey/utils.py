@@ -4,24 +4,56 @@ from __future__ import annotations
 import csv
 import json
 import re
+import threading
 import time
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import httpx
+import numpy as np
 
 from .models import RentalListing, SurveyQuery
 
+try:  # orjson is an optional speedup; fall back to the stdlib encoder.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 YEN_PATTERN = re.compile(r"([0-9]+(?:\.[0-9]+)?)\s*(万円|万|円)")
 AREA_PATTERN = re.compile(r"([0-9]+(?:\.[0-9]+)?)")
 DATE_PATTERN = re.compile(r"(\d{4})年(\d{1,2})月")
 BUILT_AGE_PATTERN = re.compile(r"築(\d+)年")
 STATION_PATTERN = re.compile(r"(?P<station>[^\s　]+)\s*徒歩\s*(?P<minutes>\d+)")
 
+# Field strings ("4.5万円", "徒歩5分", ...) repeat heavily across cards, so the
+# parsers below are memoized. Dict-returning helpers cache an immutable tuple.
+PARSE_CACHE_SIZE = 4096
+
+
+def build_http_session(user_agent: str, timeout: float = 30.0, follow_redirects: bool = True) -> httpx.Client:
+    """Create an HTTP/2 capable client meant to be shared across site clients.
+
+    Reusing one client keeps TCP/TLS connections alive between sites and
+    pages; httpx negotiates gzip/deflate transfer encoding by default.
+    """
+
+    return httpx.Client(
+        headers={"User-Agent": user_agent},
+        timeout=timeout,
+        follow_redirects=follow_redirects,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
 
 class RateLimitedClient:
-    """Thin wrapper around httpx.Client with human-like pacing."""
+    """Thin wrapper around httpx.Client with human-like pacing.
+
+    Pass ``client`` to share one connection pool between several rate limited
+    clients; it is then left open by :meth:`close`.
+    """
 
     def __init__(
         self,
@@ -29,25 +61,39 @@ class RateLimitedClient:
         min_interval: float = 1.0,
         timeout: float = 30.0,
         follow_redirects: bool = True,
+        client: Optional[httpx.Client] = None,
     ):
-        self.client = httpx.Client(
-            headers={"User-Agent": user_agent}, timeout=timeout, follow_redirects=follow_redirects
-        )
+        self._owns_client = client is None
+        self.client = client or build_http_session(user_agent, timeout=timeout, follow_redirects=follow_redirects)
         self.min_interval = max(0.1, min_interval)
         self._next_request = 0.0
+        self._lock = threading.Lock()
 
     def get(self, url: str, params: Optional[Dict[str, str]] = None) -> httpx.Response:
-        now = time.monotonic()
-        wait = self._next_request - now
+        # Reserve a start slot under the lock so concurrent callers (e.g. page
+        # fetches) stay at least min_interval apart without serializing I/O.
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + self.min_interval
+        wait = start - now
         if wait > 0:
             time.sleep(wait)
         response = self.client.get(url, params=params)
-        self._next_request = time.monotonic() + self.min_interval
         response.raise_for_status()
         return response
 
     def close(self) -> None:
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
+
+
+def dumps_json(obj: object) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON without ASCII escaping."""
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 
 def ensure_output_path(output_path: Optional[str], output_format: str) -> Path:
@@ -68,17 +114,20 @@ def write_output(listings: Iterable[RentalListing], output_path: Path, output_fo
         if not records:
             output_path.write_text("", encoding="utf-8")
             return
-        with output_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=list(records[0]).keys())
-            writer.writeheader()
-            writer.writerows(records)
+        with output_path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            # Every record comes from listing_to_dict, so all share one key order.
+            writer.writerow(records[0])
+            writer.writerows(record.values() for record in records)
     else:
-        with output_path.open("w", encoding="utf-8") as f:
-            for record in records:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        with output_path.open("wb") as f:
+            if records:
+                f.write(b"\n".join(dumps_json(record) for record in records) + b"\n")
 
 
 def listing_to_dict(listing: RentalListing) -> Dict[str, object]:
+    # Plain attribute loads on the slotted dataclass are specialised by the
+    # interpreter and beat a single operator.attrgetter over all fields.
     return {
         "title": listing.title,
         "site": listing.site,
@@ -105,7 +154,8 @@ def listing_to_dict(listing: RentalListing) -> Dict[str, object]:
     }
 
 
-def parse_yen(value: str) -> Optional[int]:
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_yen(value: Optional[str]) -> Optional[int]:
     if not value:
         return None
     value = value.replace(",", "")
@@ -122,54 +172,78 @@ def parse_yen(value: str) -> Optional[int]:
     return int(number)
 
 
-def parse_area(value: str) -> Optional[float]:
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_area(value: Optional[str]) -> Optional[float]:
     if not value:
         return None
     match = AREA_PATTERN.search(value)
     return float(match.group(1)) if match else None
 
 
-def parse_station_walk(value: str) -> Dict[str, Optional[object]]:
-    result: Dict[str, Optional[object]] = {"station": None, "walk_minutes": None}
+def parse_station_walk(value: Optional[str]) -> Dict[str, Optional[object]]:
+    station, walk_minutes = _parse_station_walk(value)
+    return {"station": station, "walk_minutes": walk_minutes}
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_station_walk(value: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     if not value:
-        return result
+        return None, None
     match = STATION_PATTERN.search(value)
     if match:
-        result["station"] = match.group("station")
-        result["walk_minutes"] = int(match.group("minutes"))
-    return result
+        return match.group("station"), int(match.group("minutes"))
+    return None, None
 
 
 def parse_built_info(value: str) -> Dict[str, Optional[object]]:
+    built_at, built_age_years = _parse_built_info(value)
+    return {"built_at": built_at, "built_age_years": built_age_years}
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_built_info(value: str) -> Tuple[Optional[date], Optional[float]]:
     if not value:
-        return {"built_at": None, "built_age_years": None}
+        return None, None
     if "新築" in value:
-        return {"built_at": None, "built_age_years": 0.0}
+        return None, 0.0
     date_match = DATE_PATTERN.search(value)
     if date_match:
         year, month = int(date_match.group(1)), int(date_match.group(2))
-        return {"built_at": date(year, month, 1), "built_age_years": _age_from(year, month)}
+        return date(year, month, 1), _age_from(year, month)
     age_match = BUILT_AGE_PATTERN.search(value)
     if age_match:
-        return {"built_at": None, "built_age_years": float(age_match.group(1))}
-    return {"built_at": None, "built_age_years": None}
+        return None, float(age_match.group(1))
+    return None, None
 
 
-def _age_from(year: int, month: int) -> float:
-    today = date.today()
+def _age_from(year: int, month: int, today: Optional[date] = None) -> float:
+    today = today or date.today()
     years = today.year - year
     month_diff = today.month - month
     return max(0.0, years + month_diff / 12)
 
 
-def compute_age_difference(subject_built: Optional[date], built: Optional[date], built_age: Optional[float]) -> Optional[float]:
+SubjectAge = Tuple[int, int, float]
+
+
+def precompute_subject_age(subject_built: Optional[date], today: Optional[date] = None) -> Optional[SubjectAge]:
+    """Return (year, month, age today) of the subject, computed once per search."""
+
     if subject_built is None:
         return None
+    return subject_built.year, subject_built.month, _age_from(subject_built.year, subject_built.month, today)
+
+
+def compute_age_difference(
+    subject: Optional[SubjectAge], built: Optional[date], built_age: Optional[float]
+) -> Optional[float]:
+    if subject is None:
+        return None
+    subject_year, subject_month, subject_age = subject
     if built:
-        delta = (built.year - subject_built.year) + (built.month - subject_built.month) / 12
+        delta = (built.year - subject_year) + (built.month - subject_month) / 12
         return delta
     if built_age is not None:
-        subject_age = _age_from(subject_built.year, subject_built.month)
         return subject_age - built_age
     return None
 
@@ -185,58 +259,78 @@ def normalize_bool(value: Optional[str]) -> Optional[bool]:
     return None
 
 
-def clamp_area(area: Optional[float], target: Optional[float], tolerance: float) -> bool:
-    if area is None or target is None:
-        return True
-    return abs(area - target) <= tolerance
+# Tri-state requirement -> the listing flag value that disqualifies it.
+_REJECTED_FLAG = {"required": False, "forbidden": True}
 
 
-def clamp_minutes(minutes: Optional[int], target: Optional[int]) -> bool:
-    if target is None or minutes is None:
-        return True
-    return minutes <= target
+def numeric_filter_mask(listings: List[RentalListing], query: SurveyQuery) -> np.ndarray:
+    """Boolean mask of listings passing the area and walk-time limits.
+
+    A listing passes when its area is within ``query.area_tolerance`` of
+    ``query.area`` and its walk is at most ``query.minutes``. A missing value on
+    either side (no listing value, or no query target) never rejects.
+    """
+
+    count = len(listings)
+    mask = np.ones(count, dtype=bool)
+    if query.area is not None:
+        areas = np.fromiter((np.nan if l.area is None else l.area for l in listings), dtype=np.float64, count=count)
+        mask &= np.isnan(areas) | (np.abs(areas - query.area) <= query.area_tolerance)
+    if query.minutes is not None:
+        minutes = np.fromiter(
+            (np.nan if l.walk_minutes is None else l.walk_minutes for l in listings), dtype=np.float64, count=count
+        )
+        mask &= np.isnan(minutes) | (minutes <= query.minutes)
+    return mask
 
 
 def filter_listings(listings: Iterable[RentalListing], query: SurveyQuery) -> List[RentalListing]:
+    listings = list(listings)
+    numeric_ok = numeric_filter_mask(listings, query).tolist()
+    # Query-derived criteria are resolved once here rather than per listing.
+    madori = query.madori
+    building_type = query.building_type
+    aspect = query.aspect if query.aspect not in (None, "any") else None
+    rejected_lock = _REJECTED_FLAG.get(query.auto_lock)
+    rejected_bath = _REJECTED_FLAG.get(query.bath_toilet)
     filtered: List[RentalListing] = []
-    for listing in listings:
-        if not clamp_area(listing.area, query.area, query.area_tolerance):
-            continue
-        if not clamp_minutes(listing.walk_minutes, query.minutes):
+    for listing, passed in zip(listings, numeric_ok):
+        if not passed:
             continue
-        if query.madori and listing.madori and query.madori not in listing.madori:
+        if madori and listing.madori and madori not in listing.madori:
             continue
-        if query.building_type and listing.building_type and query.building_type not in listing.building_type:
+        if building_type and listing.building_type and building_type not in listing.building_type:
             continue
-        if query.auto_lock == "required" and listing.auto_lock is False:
+        if rejected_lock is not None and listing.auto_lock is rejected_lock:
             continue
-        if query.auto_lock == "forbidden" and listing.auto_lock is True:
+        if rejected_bath is not None and listing.bath_toilet_separate is rejected_bath:
             continue
-        if query.bath_toilet == "required" and listing.bath_toilet_separate is False:
+        if aspect and listing.aspect and aspect not in listing.aspect.lower():
             continue
-        if query.bath_toilet == "forbidden" and listing.bath_toilet_separate is True:
-            continue
-        if query.aspect not in (None, "any") and listing.aspect:
-            if query.aspect not in listing.aspect.lower():
-                continue
         filtered.append(listing)
     return filtered
 
 
+def listing_dedup_key(listing: RentalListing) -> int:
+    """Hash of the fields that identify the same unit across sites."""
+
+    return hash(
+        (
+            listing.title.strip(),
+            round(listing.area or 0.0, 1),
+            listing.rent or 0,
+            listing.management_fee or 0,
+            listing.station or "",
+            listing.walk_minutes or 0,
+        )
+    )
+
+
 def deduplicate(listings: Iterable[RentalListing]) -> List[RentalListing]:
     # TODO: Strengthen duplicate detection using fuzzy matching and property IDs.
-    unique: Dict[str, RentalListing] = {}
+    unique: Dict[int, RentalListing] = {}
     for listing in listings:
-        key = "|".join(
-            [
-                listing.title.strip(),
-                str(round(listing.area or 0.0, 1)),
-                str(listing.rent or 0),
-                str(listing.management_fee or 0),
-                listing.station or "",
-                str(listing.walk_minutes or 0),
-            ]
-        )
+        key = listing.dedup_key if listing.dedup_key is not None else listing_dedup_key(listing)
         if key in unique:
             unique[key].merge_source(listing.site)
             continue
@@ -10,6 +10,9 @@ import yaml
 
 CONFIG_PATH = Path(__file__).resolve().parents[1] / "config" / "settings.yml"
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class Settings:
@@ -20,10 +23,16 @@ class Settings:
     http_client: Dict[str, Any] = field(default_factory=dict)
     domains: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     concurrency: Dict[str, Any] = field(default_factory=dict)
+    output: Dict[str, Any] = field(default_factory=dict)
 
     def data_root(self) -> Path:
         return Path(self.paths.get("data_root", "./data")).expanduser().resolve()
 
+    def output_suffix(self) -> str:
+        """File suffix for crawl outputs; gzip is opt-in via ``output.compress``."""
+
+        return ".jsonl.gz" if self.output.get("compress", False) else ".jsonl"
+
 
 _SETTINGS_CACHE: Optional[Settings] = None
 
@@ -43,7 +52,7 @@ def get_settings(refresh: bool = False) -> Settings:
         raise FileNotFoundError(f"Settings file not found: {CONFIG_PATH}")
 
     with CONFIG_PATH.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+        raw = yaml.load(f, Loader=YAML_LOADER) or {}
 
     _SETTINGS_CACHE = Settings(**raw)
     return _SETTINGS_CACHE
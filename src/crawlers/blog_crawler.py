@@ -2,15 +2,19 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from lxml.html import HtmlElement
 
 from src.models import ContentDocument
+from src.utils.html_tree import css, parse_html, select_one, visible_text
 from src.utils.http_client import HumanHttpClient
+from src.utils.jsonl_writer import JsonlWriter
 from src.utils.text_clean import clean_text
 
 LOGGER = logging.getLogger(__name__)
@@ -24,71 +28,104 @@ class BlogCrawler:
         self.settings = settings
 
     def crawl_site(self, site_config: Dict, output_path: Path) -> int:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
         collected = 0
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        seen: set[str] = set()
-
-        with output_path.open("a", encoding="utf-8") as fh:
-            for url in site_config.get("start_urls", []):
-                for article_url in self._discover_articles(url, site_config):
-                    if article_url in seen:
-                        continue
-                    seen.add(article_url)
-                    document = self._fetch_article(article_url, site_config, today, collected + 1)
-                    if document is None:
-                        continue
-                    fh.write(document.to_json() + "\n")
-                    collected += 1
+        site_name = site_config.get("name", "unknown")
+        max_tasks = max(1, int(self.settings.concurrency.get("max_tasks", 2)))
+
+        # Fetches are network bound, so up to concurrency.max_tasks run at once;
+        # each request still goes through the robots.txt check and human-like wait.
+        with ThreadPoolExecutor(max_workers=max_tasks) as pool, JsonlWriter(output_path) as writer:
+            # dict.fromkeys drops repeated URLs while keeping discovery order.
+            article_urls: List[str] = list(
+                dict.fromkeys(
+                    chain.from_iterable(
+                        pool.map(
+                            lambda url: self._discover_articles(url, site_config),
+                            site_config.get("start_urls", []),
+                        )
+                    )
+                )
+            )
+
+            # Write in completion order; ids are numbered as documents arrive.
+            for document in self._fetch_articles(pool, article_urls, site_config, window=2 * max_tasks):
+                if document is None:
+                    continue
+                collected += 1
+                document.id = f"blog_{today}_{site_name}_{collected:04d}"
+                writer.write(document.to_json_bytes())
         LOGGER.info("%s: collected %s articles", site_config.get("name"), collected)
         return collected
 
+    def _fetch_articles(
+        self, pool: ThreadPoolExecutor, article_urls: List[str], site_config: Dict, window: int
+    ) -> Iterator[Optional[ContentDocument]]:
+        """Yield fetched articles in completion order with at most ``window`` in flight.
+
+        Finished futures are dropped as soon as they are consumed, so documents
+        don't pile up in memory. If a fetch raises, queued fetches are cancelled
+        before the error propagates, so the crawl fails fast like the serial
+        loop did instead of draining the rest of the site first.
+        """
+
+        urls = iter(article_urls)
+        pending: Set[Future] = {pool.submit(self._fetch_article, url, site_config) for url in islice(urls, window)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    document = future.result()
+                    next_url = next(urls, None)
+                    if next_url is not None:
+                        pending.add(pool.submit(self._fetch_article, next_url, site_config))
+                    yield document
+        finally:
+            for future in pending:
+                future.cancel()
+
     def _discover_articles(self, listing_url: str, site_config: Dict) -> Iterable[str]:
         response = self.http_client.get(listing_url)
         if response is None or response.status_code >= 400:
             LOGGER.warning("Failed to fetch listing %s", listing_url)
             return []
 
-        soup = BeautifulSoup(response.text, "lxml")
+        tree = parse_html(response.content, response.encoding)
         selector = site_config.get("article_link_selector", "a")
         base_url = site_config.get("base_url", listing_url)
         links = []
-        for link in soup.select(selector):
+        for link in css(selector)(tree):
             href = link.get("href")
             if not href:
                 continue
             links.append(urljoin(base_url, href))
         return links
 
-    def _fetch_article(
-        self,
-        article_url: str,
-        site_config: Dict,
-        today: str,
-        sequence: int,
-    ) -> Optional[ContentDocument]:
+    def _fetch_article(self, article_url: str, site_config: Dict) -> Optional[ContentDocument]:
+        """Fetch and parse one article; ``id`` is assigned by crawl_site."""
+
         response = self.http_client.get(article_url)
         if response is None or response.status_code >= 400:
             LOGGER.warning("Failed to fetch article %s", article_url)
             return None
 
-        soup = BeautifulSoup(response.text, "lxml")
-        title = self._extract_text(soup, site_config.get("title_selector"))
-        if not title and soup.title and soup.title.string:
-            title = clean_text(soup.title.string)
-        content = self._extract_content(soup, site_config.get("content_selector"))
-        if not content:
-            content = clean_text(soup.get_text(separator="\n"))
+        tree = parse_html(response.content, response.encoding)
+        title = self._extract_text(tree, site_config.get("title_selector"))
+        if not title:
+            title = clean_text(tree.findtext(".//title") or "")
+        # Whole-page text is only extracted when neither selector nor <article> had any.
+        content = self._extract_content(tree, site_config.get("content_selector")) or clean_text(
+            visible_text(tree, "\n")
+        )
         if not content.strip():
             LOGGER.debug("Empty content for %s", article_url)
             return None
 
-        published_at = self._extract_text(soup, site_config.get("date_selector"))
-        author = self._extract_text(soup, site_config.get("author_selector"))
-        doc_id = f"blog_{today}_{site_config.get('name', 'unknown')}_{sequence:04d}"
+        published_at = self._extract_text(tree, site_config.get("date_selector"))
+        author = self._extract_text(tree, site_config.get("author_selector"))
 
         return ContentDocument(
-            id=doc_id,
+            id="",
             source="blog",
             url=article_url,
             title=title or article_url,
@@ -100,22 +137,22 @@ class BlogCrawler:
         )
 
     @staticmethod
-    def _extract_text(soup: BeautifulSoup, selector: Optional[str]) -> Optional[str]:
+    def _extract_text(tree: HtmlElement, selector: Optional[str]) -> Optional[str]:
         if not selector:
             return None
-        node = soup.select_one(selector)
-        if not node:
+        node = select_one(tree, css(selector))
+        if node is None:
             return None
-        return clean_text(node.get_text(separator=" "))
+        return clean_text(visible_text(node, " "))
 
     @staticmethod
-    def _extract_content(soup: BeautifulSoup, selector: Optional[str]) -> str:
+    def _extract_content(tree: HtmlElement, selector: Optional[str]) -> Optional[str]:
         if selector:
-            node = soup.select_one(selector)
-            if node:
-                return clean_text(node.get_text(separator="\n"))
+            node = select_one(tree, css(selector))
+            if node is not None:
+                return clean_text(visible_text(node, "\n"))
         # fallback to article body
-        article = soup.find("article")
-        if article:
-            return clean_text(article.get_text(separator="\n"))
-        return clean_text(soup.get_text(separator="\n"))
+        article = next(tree.iter("article"), None)
+        if article is not None:
+            return clean_text(visible_text(article, "\n"))
+        return None
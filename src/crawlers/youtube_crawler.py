@@ -6,16 +6,19 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
-from xml.etree import ElementTree
 
 import httpx
 from googleapiclient.discovery import build
+from lxml import etree
 
 from src.models import ContentDocument
+from src.utils.jsonl_writer import JsonlWriter
 from src.utils.text_clean import clean_text
 
 LOGGER = logging.getLogger(__name__)
 
+_TRANSCRIPT_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
 
 class YouTubeCrawler:
     def __init__(self, api_key: str, settings) -> None:
@@ -62,24 +65,23 @@ class YouTubeCrawler:
     def fetch_transcript(self, video_id: str, lang: str = "ja") -> Optional[str]:
         url = f"https://www.youtube.com/api/timedtext?lang={lang}&v={video_id}"
         response = self._http.get(url)
-        if response.status_code != 200 or not response.text:
+        if response.status_code != 200 or not response.content:
             LOGGER.debug("Transcript not available for %s", video_id)
             return None
         try:
-            root = ElementTree.fromstring(response.text)
-        except ElementTree.ParseError:
+            root = etree.fromstring(response.content, parser=_TRANSCRIPT_PARSER)
+        except etree.XMLSyntaxError:
             return None
-        texts = [clean_text(node.text or "") for node in root.findall("text") if node.text]
-        return "\n".join(filter(None, texts)) or None
+        texts = (clean_text(node.text) for node in root.iter("text") if node.text)
+        return "\n".join(text for text in texts if text) or None
 
     def crawl_channel(self, channel_config: Dict, output_path: Path) -> int:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
         today = datetime.utcnow().strftime("%Y-%m-%d")
         channel_id = self._resolve_channel_id(channel_config)
         videos = self.list_videos_from_channel(channel_id)
         collected = 0
 
-        with output_path.open("a", encoding="utf-8") as fh:
+        with JsonlWriter(output_path) as writer:
             for idx, video in enumerate(videos, start=1):
                 transcript = self.fetch_transcript(video["videoId"]) or ""
                 document = ContentDocument(
@@ -93,7 +95,7 @@ class YouTubeCrawler:
                     tags=channel_config.get("tags", []),
                     content=transcript,
                 )
-                fh.write(document.to_json() + "\n")
+                writer.write(document.to_json_bytes())
                 collected += 1
         LOGGER.info("%s: collected %s videos", channel_config.get("name", channel_id), collected)
         return collected
@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+try:  # orjson is an optional speedup; fall back to the stdlib encoder.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class ContentDocument:
     """Dataclass representing the JSONL schema for crawled content."""
 
@@ -21,9 +26,25 @@ class ContentDocument:
     tags: List[str] = field(default_factory=list)
     content: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        # All fields are flat, so a shallow dict replaces asdict()'s deep copy.
+        return {name: getattr(self, name) for name in _FIELDS}
+
     def to_json(self) -> str:
-        return json.dumps(asdict(self), ensure_ascii=False)
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode("utf-8")
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    def to_json_bytes(self) -> bytes:
+        """UTF-8 encoded JSON line, for writers that open files in binary mode."""
+
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), ensure_ascii=False).encode("utf-8")
 
     @staticmethod
     def now_iso() -> str:
         return datetime.utcnow().isoformat()
+
+
+_FIELDS = tuple(f.name for f in fields(ContentDocument))
@@ -8,7 +8,7 @@ from typing import List
 
 import yaml
 
-from src.config import ensure_data_directories, get_settings
+from src.config import YAML_LOADER, ensure_data_directories, get_settings
 from src.crawlers.blog_crawler import BlogCrawler
 from src.utils.http_client import HumanHttpClient
 
@@ -20,7 +20,7 @@ def load_seeds() -> List[dict]:
     if not SEED_PATH.exists():
         raise FileNotFoundError(f"Seed file not found: {SEED_PATH}")
     with SEED_PATH.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or []
+        return yaml.load(f, Loader=YAML_LOADER) or []
 
 
 def configure_logging(log_path: Path) -> None:
@@ -47,6 +47,7 @@ def main() -> None:
         user_agent=http_settings.get("user_agent", "Mozilla/5.0"),
         domain_factors=settings.domains,
         timeout=settings.http_client.get("timeout", 30),
+        robots_cache_dir=settings.data_root() / ".cache" / "robots",
     )
     crawler = BlogCrawler(http_client, settings)
 
@@ -54,7 +55,7 @@ def main() -> None:
     raw_dir = settings.data_root() / "raw" / "blogs"
 
     for site in seeds:
-        output_path = raw_dir / f"{today}-{site.get('name', 'unknown')}.jsonl"
+        output_path = raw_dir / f"{today}-{site.get('name', 'unknown')}{settings.output_suffix()}"
         crawler.crawl_site(site, output_path)
 
     http_client.close()
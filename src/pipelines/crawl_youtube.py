@@ -9,7 +9,7 @@ from typing import List
 
 import yaml
 
-from src.config import ensure_data_directories, get_settings
+from src.config import YAML_LOADER, ensure_data_directories, get_settings
 from src.crawlers.youtube_crawler import YouTubeCrawler
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -20,7 +20,7 @@ def load_seeds() -> List[dict]:
     if not SEED_PATH.exists():
         raise FileNotFoundError(f"Seed file not found: {SEED_PATH}")
     with SEED_PATH.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or []
+        return yaml.load(f, Loader=YAML_LOADER) or []
 
 
 def configure_logging(log_path: Path) -> None:
@@ -50,7 +50,7 @@ def main() -> None:
 
     for channel in seeds:
         identifier = channel.get("name") or channel.get("channel_id") or "channel"
-        output_path = raw_dir / f"{today}-{identifier}.jsonl"
+        output_path = raw_dir / f"{today}-{identifier}{settings.output_suffix()}"
         crawler.crawl_channel(channel, output_path)
 
     crawler.close()
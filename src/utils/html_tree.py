@@ -0,0 +1,57 @@
+"""lxml parsing and text helpers for crawled HTML pages."""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional
+
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+
+# Text nodes at or below the context node, except those inside script, style
+# or template. Comments and processing instructions are not text() nodes, so
+# they drop out as well; tails of skipped elements are kept.
+_VISIBLE_TEXT = etree.XPath(
+    "descendant-or-self::text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+
+
+def parse_html(content: bytes, encoding: Optional[str] = None) -> HtmlElement:
+    """Parse a response body into an HTML tree.
+
+    The raw bytes are decoded by libxml2 with ``encoding`` (normally
+    ``response.encoding``), because lxml rejects ``str`` input that starts with
+    an ``<?xml ... encoding=...?>`` declaration, as XHTML templates do. A body
+    without any element (empty, whitespace or only a comment) yields an empty
+    ``<html>`` root instead of raising.
+    """
+
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        # Charset libxml2 does not know; let it sniff the document instead.
+        parser = lxml.html.HTMLParser()
+    try:
+        return lxml.html.document_fromstring(content, parser=parser)
+    except etree.ParserError:
+        return lxml.html.document_fromstring(b"<html></html>")
+
+
+@lru_cache(maxsize=None)
+def css(expr: str) -> CSSSelector:
+    """Compile a CSS selector once; configured selectors repeat for every page of a site."""
+
+    return CSSSelector(expr, translator="html")
+
+
+def select_one(node: HtmlElement, selector: CSSSelector) -> Optional[HtmlElement]:
+    found = selector(node)
+    return found[0] if found else None
+
+
+def visible_text(node: HtmlElement, separator: str) -> str:
+    """Join the node's visible text like BeautifulSoup's ``get_text(separator)``."""
+
+    return separator.join(_VISIBLE_TEXT(node))
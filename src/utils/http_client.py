@@ -1,11 +1,16 @@
 """HTTP client utilities with human-like waits and robots.txt handling."""
 from __future__ import annotations
 
+import json
 import logging
 import random
+import threading
 import time
-from typing import Dict, Optional
-from urllib.parse import urlparse
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote, unquote, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
 
 import httpx
@@ -14,36 +19,85 @@ import httpx
 LOGGER = logging.getLogger(__name__)
 
 
-def human_like_wait(char_count: int, domain_factor: float = 1.0) -> None:
+# Response body sizes (bytes) at which the base wait steps up, and the base
+# wait in seconds for each band: <1000, <3000, <7000 and anything larger.
+_WAIT_THRESHOLDS = (1000, 3000, 7000)
+_WAIT_BASES = (0.5, 1.0, 1.5, 2.5)
+_WAIT_JITTER = 0.7
+
+
+def human_like_wait(size: int, domain_factor: float = 1.0) -> None:
     """Sleep for a short time based on response size to mimic human pacing."""
 
-    if char_count < 1000:
-        base = 0.5
-    elif char_count < 3000:
-        base = 1.0
-    elif char_count < 7000:
-        base = 1.5
-    else:
-        base = 2.5
+    base = _WAIT_BASES[bisect_right(_WAIT_THRESHOLDS, size)]
+    time.sleep((base + random.random() * _WAIT_JITTER) * domain_factor)
+
+
+ROBOTS_CACHE_TTL = 24 * 60 * 60
+ROBOTS_MEMORY_ENTRIES = 256
+ROBOTS_VERDICT_ENTRIES = 8192
+
+
+def _robots_path(url: str) -> str:
+    """Normalise a URL the way RobotFileParser.can_fetch does before matching."""
+
+    parsed = urlparse(unquote(url))
+    path = urlunparse(("", "", parsed.path, parsed.params, parsed.query, parsed.fragment))
+    return quote(path) or "/"
+
+
+class _RobotsRules:
+    """A domain's robots.txt parser plus memoised verdicts.
+
+    Rules match by ``startswith`` on the normalised path, so a verdict depends
+    only on the first ``prefix_length`` characters (the longest rule path);
+    URLs sharing that prefix share the verdict.
+    """
+
+    __slots__ = ("parser", "prefix_length", "verdicts")
+
+    def __init__(self, parser: RobotFileParser) -> None:
+        self.parser = parser
+        entries = [*parser.entries, parser.default_entry]
+        self.prefix_length = max(
+            (len(line.path) for entry in entries if entry for line in entry.rulelines), default=0
+        )
+        self.verdicts: Dict[Tuple[str, str], bool] = {}
 
-    jitter = random.uniform(0, 0.7)
-    time.sleep((base + jitter) * domain_factor)
+    def can_fetch(self, user_agent: str, url: str) -> bool:
+        key = (user_agent, _robots_path(url)[: self.prefix_length])
+        verdict = self.verdicts.get(key)
+        if verdict is None:
+            verdict = self.parser.can_fetch(user_agent, url)
+            if len(self.verdicts) >= ROBOTS_VERDICT_ENTRIES:
+                self.verdicts.clear()
+            self.verdicts[key] = verdict
+        return verdict
 
 
 class HumanHttpClient:
-    """Thin wrapper around httpx.Client that respects robots.txt and waits."""
+    """Thin wrapper around httpx.Client that respects robots.txt and waits.
+
+    When ``robots_cache_dir`` is given, fetched robots.txt responses are kept
+    there for ``robots_cache_ttl`` seconds so later runs skip the round-trip.
+    """
 
     def __init__(
         self,
         user_agent: str,
         domain_factors: Optional[Dict[str, Dict[str, float]]] = None,
         timeout: int = 30,
+        robots_cache_dir: Optional[Path] = None,
+        robots_cache_ttl: float = ROBOTS_CACHE_TTL,
     ) -> None:
         headers = {"User-Agent": user_agent}
         self._client = httpx.Client(headers=headers, timeout=timeout)
         self.user_agent = user_agent
         self.domain_factors = domain_factors or {}
-        self._robot_parsers: Dict[str, RobotFileParser] = {}
+        self.robots_cache_dir = robots_cache_dir
+        self.robots_cache_ttl = robots_cache_ttl
+        self._robot_rules: "OrderedDict[str, _RobotsRules]" = OrderedDict()
+        self._robots_lock = threading.Lock()
 
     def close(self) -> None:
         self._client.close()
@@ -60,25 +114,85 @@ class HumanHttpClient:
         default = self.domain_factors.get("default", {})
         return float(default.get("factor", 1.0))
 
-    def _get_robot_parser(self, url: str) -> RobotFileParser:
+    def _get_robot_rules(self, url: str) -> _RobotsRules:
         parsed = urlparse(url)
         domain = parsed.netloc
-        if domain in self._robot_parsers:
-            return self._robot_parsers[domain]
+        # Held while fetching so concurrent workers don't fetch robots.txt twice.
+        with self._robots_lock:
+            return self._load_robot_rules(parsed.scheme, domain)
+
+    def _load_robot_rules(self, scheme: str, domain: str) -> _RobotsRules:
+        if domain in self._robot_rules:
+            self._robot_rules.move_to_end(domain)
+            return self._robot_rules[domain]
 
-        robots_url = f"{parsed.scheme}://{domain}/robots.txt"
+        robots_url = f"{scheme}://{domain}/robots.txt"
         parser = RobotFileParser()
         parser.set_url(robots_url)
+        robots = self._read_cached_robots(domain)
+        if robots is None:
+            robots = self._fetch_robots(robots_url)
+            if robots is not None:
+                self._write_cached_robots(domain, *robots)
+        if robots is not None:
+            self._apply_robots(parser, *robots)
+        rules = self._robot_rules[domain] = _RobotsRules(parser)
+        if len(self._robot_rules) > ROBOTS_MEMORY_ENTRIES:
+            self._robot_rules.popitem(last=False)
+        return rules
+
+    def _fetch_robots(self, robots_url: str) -> Optional[Tuple[int, str]]:
         try:
-            parser.read()
+            response = self._client.get(robots_url, follow_redirects=True)
         except Exception as exc:  # pragma: no cover - defensive logging
-            LOGGER.warning("Failed to read robots.txt for %s: %s", domain, exc)
-        self._robot_parsers[domain] = parser
-        return parser
+            LOGGER.warning("Failed to read robots.txt for %s: %s", robots_url, exc)
+            return None
+        if response.status_code >= 500:
+            LOGGER.warning("Failed to read robots.txt for %s: HTTP %s", robots_url, response.status_code)
+            return None
+        return response.status_code, response.text
+
+    @staticmethod
+    def _apply_robots(parser: RobotFileParser, status: int, body: str) -> None:
+        # Mirrors RobotFileParser.read(): auth errors disallow, other 4xx allow.
+        if status in (401, 403):
+            parser.disallow_all = True
+        elif status >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(body.splitlines())
+
+    def _robots_cache_path(self, domain: str) -> Optional[Path]:
+        if self.robots_cache_dir is None:
+            return None
+        return self.robots_cache_dir / f"robots-{domain.replace(':', '_')}.json"
+
+    def _read_cached_robots(self, domain: str) -> Optional[Tuple[int, str]]:
+        path = self._robots_cache_path(domain)
+        if path is None or not path.exists():
+            return None
+        if time.time() - path.stat().st_mtime > self.robots_cache_ttl:
+            return None
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+            return int(cached["status"]), str(cached["body"])
+        except (OSError, ValueError, KeyError) as exc:
+            LOGGER.debug("Ignoring unreadable robots cache %s: %s", path, exc)
+            return None
+
+    def _write_cached_robots(self, domain: str, status: int, body: str) -> None:
+        path = self._robots_cache_path(domain)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({"status": status, "body": body}, ensure_ascii=False), encoding="utf-8")
+        except OSError as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("Failed to cache robots.txt for %s: %s", domain, exc)
 
     def _is_allowed(self, url: str) -> bool:
-        parser = self._get_robot_parser(url)
-        allowed = parser.can_fetch(self.user_agent, url)
+        rules = self._get_robot_rules(url)
+        allowed = rules.can_fetch(self.user_agent, url)
         return allowed if allowed is not None else True
 
     def get(self, url: str, **kwargs) -> Optional[httpx.Response]:
@@ -88,5 +202,5 @@ class HumanHttpClient:
             return None
 
         response = self._client.get(url, **kwargs)
-        human_like_wait(len(response.text), self._domain_factor(domain))
+        human_like_wait(len(response.content), self._domain_factor(domain))
         return response
@@ -0,0 +1,55 @@
+"""Buffered JSONL writer shared by the crawlers."""
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from typing import BinaryIO, List
+
+DEFAULT_BATCH_SIZE = 256
+WRITE_BUFFER_SIZE = 1 << 20
+# Level 1 gets most of the size reduction on JSON text for a fraction of the CPU.
+GZIP_LEVEL = 1
+
+
+class JsonlWriter:
+    """Append encoded JSON lines to a file in batches instead of one write per line.
+
+    Lines are UTF-8 ``bytes`` (e.g. ``ContentDocument.to_json_bytes()``) and go
+    to a binary handle, so no text-layer encoding happens on write. Paths ending
+    in ``.gz`` are gzip-compressed; each run appends a new gzip member.
+    """
+
+    def __init__(self, path: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh: BinaryIO
+        if path.suffix == ".gz":
+            self._fh = gzip.open(path, "ab", compresslevel=GZIP_LEVEL)
+        else:
+            self._fh = path.open("ab", buffering=WRITE_BUFFER_SIZE)
+        self._batch: List[bytes] = []
+        self.batch_size = batch_size
+
+    def write(self, line: bytes) -> None:
+        self._batch.append(line)
+        if len(self._batch) >= self.batch_size:
+            self._drain()
+
+    def _drain(self) -> None:
+        # Hands the batch to the handle's buffer (or compressor) without flushing
+        # it, so the 1 MiB buffer fills and gzip avoids a sync flush per batch.
+        if self._batch:
+            self._fh.write(b"\n".join(self._batch) + b"\n")
+            self._batch.clear()
+
+    def close(self) -> None:
+        try:
+            self._drain()
+            self._fh.flush()
+        finally:
+            self._fh.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self.close()